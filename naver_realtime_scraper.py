@@ -5,33 +5,64 @@ Usage:
   python3 naver_realtime_scraper.py
   python3 naver_realtime_scraper.py --json
   python3 naver_realtime_scraper.py --no-headless
+  python3 naver_realtime_scraper.py --persist
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
+import os
 import re
 import sys
-import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
-from collections import Counter
-from typing import Iterable
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, Iterator
 
 try:
-    from bs4 import BeautifulSoup
+    import h2  # noqa: F401 (httpx.Client(http2=True)에 필요)
+    import httpx
 except ModuleNotFoundError:
     print(
-        "필수 모듈이 없습니다. 설치: python3 -m pip install beautifulsoup4 selenium",
+        "필수 모듈이 없습니다. 설치: python3 -m pip install 'httpx[http2]'",
         file=sys.stderr,
     )
     raise
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ModuleNotFoundError:
+    # selectolax가 없으면 BeautifulSoup(순수 Python 파서)으로 대체
+    LexborHTMLParser = None
+    try:
+        from bs4 import BeautifulSoup
+    except ModuleNotFoundError:
+        print(
+            "필수 모듈이 없습니다. 설치: python3 -m pip install selectolax",
+            file=sys.stderr,
+        )
+        raise
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 try:
     from selenium import webdriver
     from selenium.common.exceptions import WebDriverException, TimeoutException
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.support.ui import WebDriverWait
 except ModuleNotFoundError:
     print(
@@ -50,32 +81,126 @@ except ModuleNotFoundError:
     raise
 
 
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+_HTTP_PREFIXES = ("http://", "https://")
+_STOP: frozenset[str] = frozenset(
+    {
+        "기자",
+        "뉴스",
+        "오늘",
+        "정부",
+        "시장",
+        "한국",
+        "속보",
+        "관련",
+        "대한",
+    }
+)
+
+_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+)
+
+# 인기기사 페이지는 서버 렌더링이므로 브라우저 없이 HTTP로 가져옴 (연결 재사용)
+_HTTP = httpx.Client(
+    http2=True,
+    headers={"User-Agent": _UA, "Accept-Language": "ko-KR"},
+    timeout=10.0,
+    follow_redirects=True,
+)
+atexit.register(_HTTP.close)
+
+# 인기기사 조건부 요청(ETag/Last-Modified) 캐시
+_CACHE_META = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "treand-scroller"
+    / "meta.json"
+)
+# 파싱 로직이 바뀌면 올려서 이전 캐시를 무효화
+_CACHE_VERSION = 1
+
+# 텍스트 추출에 불필요한 리소스는 받지 않음
+_BLOCKED_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*.mp4",
+    "*.css",
+]
+
+_KEYWORD_SEL = 'tbody[jsname="cC57zf"] div.mZ3RIc'
+
+# 후보 선택자를 하나로 묶어 DOM을 한 번만 순회 (중복은 아래 dedup에서 제거)
+_ARTICLE_SEL = ", ".join(
+    [
+        ".rankingnews_list .list_title",
+        ".rankingnews_list a[href*='/article/']",
+        ".rankingnews_box a[href*='/article/']",
+        ".rankingnews_list li a",
+        ".rankingnews_box li a",
+    ]
+)
+
+# 브라우저 안에서 필요한 필드만 뽑아 반환 (page_source 직렬화/재파싱 생략)
+_KEYWORDS_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]), "
+    "e => e.textContent.trim());"
+)
+
+
 def unique_top(values: Iterable[str], limit: int = 10) -> list[str]:
-    out: list[str] = []
-    seen: set[str] = set()
-    for v in values:
-        t = re.sub(r"\s+", " ", str(v or "")).strip()
-        if not t or t in seen:
-            continue
-        seen.add(t)
-        out.append(t)
-        if len(out) >= limit:
-            break
-    return out
+    norm = (t for v in values if (t := " ".join(str(v or "").split())))
+    return list(dict.fromkeys(norm))[:limit]
 
 
 def normalize_article_href(href: str) -> str:
     if not href:
         return ""
-    if href.startswith("http://") or href.startswith("https://"):
+    # 첫 글자로 분기 (대부분의 네이버 링크는 "/article/..." 형태)
+    c0 = href[0]
+    if c0 == "/":
+        return f"https:{href}" if href[1:2] == "/" else f"https://news.naver.com{href}"
+    if c0 == "h" and href.startswith(_HTTP_PREFIXES):
         return href
-    if href.startswith("//"):
-        return f"https:{href}"
-    if href.startswith("/"):
-        return f"https://news.naver.com{href}"
     return f"https://news.naver.com/{href}"
 
 
+def parse_html(html: str):
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, "html.parser")
+
+
+def select_nodes(tree, selector: str, sep: str = "") -> Iterator[tuple[str, str]]:
+    """CSS 선택자에 맞는 노드들의 (텍스트, href)를 순서대로 생성."""
+    if LexborHTMLParser is not None:
+        # lexbor는 여러 선택자에 걸리는 노드를 중복 반환하므로 텍스트 추출 전에 건너뜀
+        seen: set[int] = set()
+        for n in tree.css(selector):
+            if n.mem_id in seen:
+                continue
+            seen.add(n.mem_id)
+            yield n.text(separator=sep, strip=True), n.attributes.get("href") or ""
+    else:
+        for n in tree.select(selector):
+            yield n.get_text(sep, strip=True), n.get("href", "")
+
+
+@lru_cache(maxsize=1)
+def _driver_path() -> str:
+    # CHROMEDRIVER가 지정되어 있으면 webdriver-manager를 거치지 않음
+    path = os.environ.get("CHROMEDRIVER")
+    if path:
+        return path
+    os.environ.setdefault("WDM_LOCAL", "1")
+    return ChromeDriverManager().install()
+
+
 def build_driver(headless: bool = True) -> webdriver.Chrome:
     opts = Options()
     if headless:
@@ -84,19 +209,66 @@ def build_driver(headless: bool = True) -> webdriver.Chrome:
     opts.add_argument("--no-sandbox")
     opts.add_argument("--disable-dev-shm-usage")
     opts.add_argument("--lang=ko-KR")
-    opts.add_argument(
-        "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+    opts.add_argument(f"--user-agent={_UA}")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-background-networking")
+    opts.add_argument("--disable-sync")
+    opts.add_argument("--disable-translate")
+    opts.add_argument("--metrics-recording-only")
+    opts.add_argument("--mute-audio")
+    opts.add_argument("--disable-breakpad")
+    opts.add_argument("--disable-features=Translate,BackForwardCache,OptimizationHints")
+    opts.add_argument("--renderer-process-limit=1")
+    # DOMContentLoaded 시점에 driver.get 반환
+    opts.page_load_strategy = "eager"
+    opts.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
     )
-    service = Service(ChromeDriverManager().install())
+    service = Service(_driver_path())
     driver = webdriver.Chrome(service=service, options=opts)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URLS})
     driver.set_page_load_timeout(20)
     return driver
 
 
+# headless 여부별로 하나씩 유지하는 재사용 드라이버
+_DRIVERS: dict[bool, webdriver.Chrome] = {}
+_DRIVER_LOCK = threading.RLock()
+
+
+def get_driver(headless: bool = True) -> webdriver.Chrome:
+    """프로세스 전체에서 재사용하는 드라이버. 종료 시 atexit으로 정리."""
+    with _DRIVER_LOCK:
+        driver = _DRIVERS.get(headless)
+        if driver is None:
+            driver = _DRIVERS[headless] = build_driver(headless=headless)
+        return driver
+
+
+def discard_driver(headless: bool = True) -> None:
+    """재사용 드라이버를 종료하고 버림. 다음 get_driver()에서 새로 생성."""
+    with _DRIVER_LOCK:
+        driver = _DRIVERS.pop(headless, None)
+    if driver is not None:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+def _quit_drivers() -> None:
+    for headless in list(_DRIVERS):
+        discard_driver(headless)
+
+
+atexit.register(_quit_drivers)
+
+
 def wait_dom_ready(driver: webdriver.Chrome, timeout: int = 12) -> None:
     WebDriverWait(driver, timeout).until(
-        lambda d: d.execute_script("return document.readyState") == "complete"
+        lambda d: d.execute_script("return document.readyState") != "loading"
     )
 
 
@@ -106,121 +278,152 @@ def scrape_realtime_keywords(driver: webdriver.Chrome) -> list[str]:
     try:
         driver.get(url)
         wait_dom_ready(driver)
-        time.sleep(5)
-        html = driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-
-        table_body = soup.find("tbody", attrs={"jsname": "cC57zf"})
-        if not table_body:
-            return []
-
-        rows = table_body.find_all("tr")
-        if not rows:
-            return []
-
-        raw: list[str] = []
-        for row in rows:
-            keyword_div = row.find("div", class_="mZ3RIc")
-            if keyword_div:
-                raw.append(keyword_div.get_text(strip=True))
-        return unique_top(raw, 10)
-    except (TimeoutException, WebDriverException):
+        # 키워드 표가 그려지는 즉시 진행 (고정 대기 없음)
+        WebDriverWait(driver, 8).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, _KEYWORD_SEL))
+        )
+        raw = driver.execute_script(_KEYWORDS_JS, _KEYWORD_SEL)
+        return unique_top(raw or [], 10)
+    except TimeoutException:
+        # 그 밖의 WebDriverException(세션 종료 등)은 호출자가 처리
         return []
 
 
-def scrape_popular_articles(driver: webdriver.Chrome) -> list[dict[str, str]]:
+def parse_articles(html: str) -> list[dict[str, str]]:
+    tree = parse_html(html)
+    dedup: list[dict[str, str]] = []
+    seen: set[tuple[str, str]] = set()
+    for text, link in select_nodes(tree, _ARTICLE_SEL, " "):
+        title = " ".join(text.split())
+        href = normalize_article_href(link)
+        if len(title) < 4:
+            continue
+        if "/article/" not in href:
+            continue
+        key = (title, href)
+        if key in seen:
+            continue
+        seen.add(key)
+        dedup.append({"title": title, "href": href})
+        if len(dedup) >= 10:
+            break
+    return dedup
+
+
+def load_http_cache() -> dict:
+    try:
+        meta = json.loads(_CACHE_META.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(meta, dict) or meta.get("version") != _CACHE_VERSION:
+        return {}
+    return meta.get("pages") or {}
+
+
+def save_http_cache(cache: dict) -> None:
+    # 임시 파일에 쓴 뒤 교체해 동시 실행에서도 깨진 파일이 남지 않게 함
+    meta = {"version": _CACHE_VERSION, "pages": cache}
+    try:
+        _CACHE_META.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_CACHE_META.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp, _CACHE_META)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def fetch_articles(url: str, cache: dict) -> list[dict[str, str]]:
+    """조건부 요청으로 기사 목록을 가져옴. 304이면 이전 파싱 결과를 재사용."""
+    entry = cache.get(url) or {}
+    headers: dict[str, str] = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = _HTTP.get(url, headers=headers)
+    if resp.status_code == 304 and "articles" in entry:
+        return entry["articles"]
+    resp.raise_for_status()
+
+    articles = parse_articles(resp.text)
+    if len(articles) >= 10:
+        cache[url] = {
+            "etag": resp.headers.get("ETag", ""),
+            "last_modified": resp.headers.get("Last-Modified", ""),
+            "articles": articles,
+        }
+        save_http_cache(cache)
+    elif cache.pop(url, None) is not None:
+        # 기사가 부족한 응답(차단/동의 페이지 등)은 캐시하지 않고 이전 항목도 지움
+        save_http_cache(cache)
+    return articles
+
+
+def scrape_popular_articles() -> list[dict[str, str]]:
     urls = [
         "https://news.naver.com/main/ranking/popularDay.naver",
         "https://news.naver.com/main/ranking/popularDay.naver?mid=etc&sid1=111",
     ]
 
-    selectors = [
-        ".rankingnews_list .list_title",
-        ".rankingnews_list a[href*='/article/']",
-        ".rankingnews_box a[href*='/article/']",
-        ".rankingnews_list li a",
-        ".rankingnews_box li a",
-    ]
-
+    cache = load_http_cache()
     for url in urls:
         try:
-            driver.get(url)
-            wait_dom_ready(driver)
-            html = driver.page_source
-            soup = BeautifulSoup(html, "html.parser")
-
-            raw: list[dict[str, str]] = []
-            for sel in selectors:
-                for a in soup.select(sel):
-                    title = re.sub(r"\s+", " ", a.get_text(" ", strip=True)).strip()
-                    href = normalize_article_href(a.get("href", ""))
-                    if len(title) < 4:
-                        continue
-                    if "/article/" not in href:
-                        continue
-                    raw.append({"title": title, "href": href})
-
-            dedup: list[dict[str, str]] = []
-            seen: set[tuple[str, str]] = set()
-            for item in raw:
-                key = (item["title"], item["href"])
-                if key in seen:
-                    continue
-                seen.add(key)
-                dedup.append(item)
-                if len(dedup) >= 10:
-                    return dedup
-        except (TimeoutException, WebDriverException):
+            articles = fetch_articles(url, cache)
+        except httpx.HTTPError:
             continue
+        if len(articles) >= 10:
+            return articles
 
     return []
 
 
 def derive_keywords_from_articles(articles: list[dict[str, str]]) -> list[str]:
-    stop = {
-        "기자",
-        "뉴스",
-        "오늘",
-        "정부",
-        "시장",
-        "한국",
-        "속보",
-        "관련",
-        "대한",
-    }
-    c = Counter()
+    c: dict[str, int] = {}
     for a in articles:
-        words = re.sub(r"[^0-9A-Za-z가-힣\s]", " ", a.get("title", "")).split()
-        for w in words:
-            w = w.strip()
-            if len(w) < 2 or w in stop:
-                continue
-            c[w] += 1
-    return [w for w, _ in c.most_common(10)]
-
+        for w in _TOKEN_RE.findall(a.get("title", "")):
+            if w not in _STOP:
+                c[w] = c.get(w, 0) + 1
+    return [w for w, _ in nlargest(10, c.items(), key=itemgetter(1))]
 
-def collect(headless: bool = True) -> dict:
-    warnings: list[str] = []
-    keywords: list[str] = []
-    articles: list[dict[str, str]] = []
 
-    try:
-        driver = build_driver(headless=headless)
-    except WebDriverException as e:
-        return {
-            "keywords": [],
-            "articles": [],
-            "warnings": [
+def fetch_realtime_keywords(
+    headless: bool, persist: bool = False
+) -> tuple[list[str], list[str]]:
+    """(키워드, 경고) 반환. persist이면 재사용 드라이버를 잠금 상태에서 사용."""
+    with _DRIVER_LOCK if persist else nullcontext():
+        try:
+            driver = get_driver(headless) if persist else build_driver(headless=headless)
+        except WebDriverException as e:
+            return [], [
                 "Chrome WebDriver 실행 실패: " + str(e),
                 "Chrome 설치 또는 Selenium Manager 네트워크 접근 상태를 확인하세요.",
-            ],
-        }
+            ]
 
-    try:
-        keywords = scrape_realtime_keywords(driver)
-        articles = scrape_popular_articles(driver)
-    finally:
-        driver.quit()
+        try:
+            return scrape_realtime_keywords(driver), []
+        except WebDriverException:
+            if persist:
+                # 죽은 세션을 계속 쓰지 않도록 버리고 다음 호출에서 새로 생성
+                discard_driver(headless)
+            return [], []
+        finally:
+            if not persist:
+                driver.quit()
+
+
+def collect(headless: bool = True, persist: bool = False) -> dict:
+    # 브라우저 렌더링과 기사 HTTP 요청을 동시에 진행
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_kw = ex.submit(fetch_realtime_keywords, headless, persist)
+        f_art = ex.submit(scrape_popular_articles)
+        keywords, warnings = f_kw.result()
+        articles = f_art.result()
 
     if not keywords:
         alt = derive_keywords_from_articles(articles)
@@ -241,35 +444,47 @@ def collect(headless: bool = True) -> dict:
     }
 
 
+def dumps_json(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def print_text(data: dict) -> None:
-    print("[실시간 검색어 TOP 10]")
-    for i, k in enumerate(data["keywords"], 1):
-        print(f"{i}. {k}")
+    out = ["[실시간 검색어 TOP 10]"]
+    out += [f"{i}. {k}" for i, k in enumerate(data["keywords"], 1)]
 
-    print("\n[실시간 인기기사 TOP 10]")
+    out.append("\n[실시간 인기기사 TOP 10]")
     for i, a in enumerate(data["articles"], 1):
-        print(f"{i}. {a['title']}")
-        print(f"   {a['href']}")
+        out.append(f"{i}. {a['title']}")
+        out.append(f"   {a['href']}")
 
     if data["warnings"]:
-        print("\n[주의]")
-        for w in data["warnings"]:
-            print(f"- {w}")
+        out.append("\n[주의]")
+        out += [f"- {w}" for w in data["warnings"]]
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--json", action="store_true", help="JSON 출력")
     parser.add_argument("--no-headless", action="store_true", help="브라우저 창 표시")
+    parser.add_argument(
+        "--persist",
+        action="store_true",
+        help="브라우저 종료를 프로세스 종료 시점으로 미룸 "
+        "(1회 실행에서는 효과 없음, 반복 수집은 collect(persist=True) 사용)",
+    )
     parser.add_argument("--out", type=str, default="", help="결과 JSON 파일 경로")
     args = parser.parse_args()
 
-    data = collect(headless=not args.no_headless)
+    data = collect(headless=not args.no_headless, persist=args.persist)
     if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(args.out, "wb") as f:
+            f.write(dumps_json(data))
     if args.json:
-        print(json.dumps(data, ensure_ascii=False, indent=2))
+        sys.stdout.buffer.write(dumps_json(data) + b"\n")
     else:
         print_text(data)
 